@@ -21,11 +21,25 @@ Utility method to visualize the alignment and errors between one or more referen
 and hypothesis pairs.
 """
 from collections import defaultdict
-from typing import List, Union, Optional
+from itertools import repeat
+from typing import Iterator, List, Union, Optional, TextIO
 
-from jiwer.process import CharacterOutput, WordOutput, AlignmentChunk
+from jiwer.process import (
+    CharacterOutput,
+    WordOutput,
+    AlignmentChunk,
+    _join_single_characters,
+)
 
-__all__ = ["visualize_alignment", "collect_error_counts", "visualize_error_counts"]
+__all__ = [
+    "visualize_alignment",
+    "write_alignment",
+    "collect_error_counts",
+    "visualize_error_counts",
+]
+
+# cache of "*" strings, keyed by length, which fill in for missing words or characters
+_STARS = {}
 
 
 def visualize_alignment(
@@ -119,110 +133,244 @@ def visualize_alignment(
                   D
         ```
     """
+    return "".join(
+        _iter_alignment_parts(output, show_measures, skip_correct, line_width)
+    )
+
+
+def write_alignment(
+    output: Union[WordOutput, CharacterOutput],
+    file: TextIO,
+    show_measures: bool = True,
+    skip_correct: bool = True,
+    line_width: Optional[int] = None,
+):
+    """
+    Write the visualization of
+    [jiwer.visualize_alignment][alignment.visualize_alignment] to a text stream.
+    The visualization is written sentence by sentence, so the complete visualization
+    never has to be held in memory as a single string.
+
+    Args:
+        output: The processed output of reference and hypothesis pair(s).
+        file: The text stream to write to, e.g. `sys.stdout` or an opened file
+        show_measures: See [jiwer.visualize_alignment][alignment.visualize_alignment]
+        skip_correct: See [jiwer.visualize_alignment][alignment.visualize_alignment]
+        line_width: See [jiwer.visualize_alignment][alignment.visualize_alignment]
+
+    Example:
+        ```python
+        import sys
+        import jiwer
+
+        out = jiwer.process_words(
+            ["short one here", "quite a bit of longer sentence"],
+            ["shoe order one", "quite bit of an even longest sentence here"],
+        )
+
+        jiwer.write_alignment(out, sys.stdout)
+        ```
+    """
+    for part in _iter_alignment_parts(output, show_measures, skip_correct, line_width):
+        file.write(part)
+
+
+def _iter_alignment_parts(
+    output: Union[WordOutput, CharacterOutput],
+    show_measures: bool = True,
+    skip_correct: bool = True,
+    line_width: Optional[int] = None,
+) -> Iterator[str]:
+    # Yields the visualization of `visualize_alignment` sentence by sentence, so that
+    # it can be written to a stream without first building the complete string.
+    _check_alignments(output)
+
     references = output.references
     hypothesis = output.hypotheses
     alignment = output.alignments
     is_cer = isinstance(output, CharacterOutput)
+    include_space_separator = not is_cer
+
+    # each sentence is followed by an empty line, except for the last sentence
+    # when no summary is shown
+    separator = ""
 
-    final_str = ""
     for idx, (gt, hp, chunks) in enumerate(zip(references, hypothesis, alignment)):
-        if skip_correct and (
-            len(chunks) == 0 or (len(chunks) == 1 and chunks[0].type == "equal")
-        ):
+        if skip_correct and _is_correct(chunks):
             continue
 
-        final_str += f"=== SENTENCE {idx+1} ===\n\n"
-        final_str += _construct_comparison_string(
-            gt, hp, chunks, include_space_seperator=not is_cer, line_width=line_width
+        yield separator + f"=== SENTENCE {idx+1} ===\n\n"
+        yield _construct_comparison_string(
+            gt,
+            hp,
+            chunks,
+            include_space_separator=include_space_separator,
+            line_width=line_width,
         )
-        final_str += "\n"
+        separator = "\n"
 
     if show_measures:
-        final_str += "=== SUMMARY ===\n"
-        final_str += f"number of sentences: {len(alignment)}\n"
-        final_str += f"substitutions={output.substitutions} "
-        final_str += f"deletions={output.deletions} "
-        final_str += f"insertions={output.insertions} "
-        final_str += f"hits={output.hits}\n"
-
-        if is_cer:
-            final_str += f"\ncer={output.cer*100:.2f}%\n"
-        else:
-            final_str += f"\nmer={output.mer*100:.2f}%"
-            final_str += f"\nwil={output.wil*100:.2f}%"
-            final_str += f"\nwip={output.wip*100:.2f}%"
-            final_str += f"\nwer={output.wer*100:.2f}%\n"
-    else:
-        # remove last newline
-        final_str = final_str[:-1]
+        yield separator + _construct_summary_string(output, is_cer)
+
+
+def _check_alignments(output: Union[WordOutput, CharacterOutput]):
+    if output.alignments is None:
+        raise ValueError(
+            "The output does not contain alignments. Please use "
+            "`return_alignments=True` when processing the reference and hypothesis "
+            "sentences."
+        )
 
-    return final_str
+
+def _is_correct(chunks: List[AlignmentChunk]) -> bool:
+    return len(chunks) == 0 or (len(chunks) == 1 and chunks[0].type == "equal")
+
+
+def _construct_summary_string(
+    output: Union[WordOutput, CharacterOutput], is_cer: bool
+) -> str:
+    summary = (
+        "=== SUMMARY ===\n"
+        f"number of sentences: {len(output.alignments)}\n"
+        f"substitutions={output.substitutions} "
+        f"deletions={output.deletions} "
+        f"insertions={output.insertions} "
+        f"hits={output.hits}\n"
+    )
+
+    if is_cer:
+        return summary + f"\ncer={output.cer*100:.2f}%\n"
+    else:
+        return summary + (
+            f"\nmer={output.mer*100:.2f}%"
+            f"\nwil={output.wil*100:.2f}%"
+            f"\nwip={output.wip*100:.2f}%"
+            f"\nwer={output.wer*100:.2f}%\n"
+        )
 
 
 def _construct_comparison_string(
     reference: List[str],
     hypothesis: List[str],
     ops: List[AlignmentChunk],
-    include_space_seperator: bool = False,
+    include_space_separator: bool = False,
     line_width: Optional[int] = None,
 ) -> str:
-    ref_str = "REF: "
-    hyp_str = "HYP: "
-    op_str = "     "
-    agg_str = ""  # aggregate string for max_chars split
+    # each line is accumulated as a list of parts, which are joined once the line is
+    # complete, to prevent quadratic string concatenation on long sentences
+    ref_parts = ["REF: "]
+    hyp_parts = ["HYP: "]
+    op_parts = ["     "]
+    line_len = len(ref_parts[0])
+    agg_parts = []  # aggregate of completed lines for max_chars split
+
+    # without separators and line breaks, a chunk of single characters (the common
+    # case for the character error rate) has a width of 1 per character, and can
+    # be appended at once instead of padding each character individually
+    join_chunks = line_width is None and not include_space_separator
 
     for op in ops:
-        if op.type == "equal" or op.type == "substitute":
+        op_type = op.type
+
+        if op_type == "equal" or op_type == "substitute":
             ref = reference[op.ref_start_idx : op.ref_end_idx]
             hyp = hypothesis[op.hyp_start_idx : op.hyp_end_idx]
-            op_char = " " if op.type == "equal" else "s"
-        elif op.type == "delete":
+            num_tokens = len(ref)
+            op_char = " " if op_type == "equal" else "S"
+        elif op_type == "delete":
             ref = reference[op.ref_start_idx : op.ref_end_idx]
-            hyp = ["*" for _ in range(len(ref))]
-            op_char = "d"
-        elif op.type == "insert":
+            num_tokens = len(ref)
+            hyp = repeat("*", num_tokens)
+            op_char = "D"
+        elif op_type == "insert":
             hyp = hypothesis[op.hyp_start_idx : op.hyp_end_idx]
-            ref = ["*" for _ in range(len(hyp))]
-            op_char = "i"
+            num_tokens = len(hyp)
+            ref = repeat("*", num_tokens)
+            op_char = "I"
         else:
-            raise ValueError(f"unparseable op name={op.type}")
-
-        op_chars = [op_char for _ in range(len(ref))]
-        for rf, hp, c in zip(ref, hyp, op_chars):
-            str_len = max(len(rf), len(hp), len(c))
+            raise ValueError(f"unparseable op name={op_type}")
+
+        if join_chunks:
+            ref_str = (
+                "*" * num_tokens if op_char == "I" else _join_single_characters(ref)
+            )
+            hyp_str = (
+                "*" * num_tokens if op_char == "D" else _join_single_characters(hyp)
+            )
+
+            if ref_str is not None and hyp_str is not None:
+                ref_parts.append(ref_str)
+                hyp_parts.append(hyp_str)
+                op_parts.append(op_char * num_tokens)
+                continue
+
+        for rf, hp in zip(ref, hyp):
+            # the width is at least 1, the length of the operation character
+            rf_len = len(rf)
+            hp_len = len(hp)
+            str_len = (rf_len if rf_len >= hp_len else hp_len) or 1
 
             if line_width is not None:
-                if len(ref_str) + str_len > line_width:
+                if line_len + str_len > line_width:
                     # aggregate the strings
-                    if include_space_seperator:
-                        agg_str += f"{ref_str[:-1]}\n{hyp_str[:-1]}\n{op_str[:-1]}\n\n"
-                    else:
-                        agg_str += f"{ref_str}\n{hyp_str}\n{op_str}\n\n"
+                    agg_parts.append(
+                        _join_comparison_lines(
+                            ref_parts, hyp_parts, op_parts, include_space_separator
+                        )
+                    )
+                    agg_parts.append("\n")
 
                     # reset the strings
-                    ref_str = "REF: "
-                    hyp_str = "HYP: "
-                    op_str = "     "
+                    ref_parts = ["REF: "]
+                    hyp_parts = ["HYP: "]
+                    op_parts = ["     "]
+                    line_len = len(ref_parts[0])
 
             if rf == "*":
-                rf = "".join(["*"] * str_len)
+                rf = _get_stars(str_len)
             elif hp == "*":
-                hp = "".join(["*"] * str_len)
+                hp = _get_stars(str_len)
+
+            ref_parts.append(rf.rjust(str_len))
+            hyp_parts.append(hp.rjust(str_len))
+            op_parts.append(op_char.rjust(str_len))
+            line_len += str_len
+
+            if include_space_separator:
+                ref_parts.append(" ")
+                hyp_parts.append(" ")
+                op_parts.append(" ")
+                line_len += 1
+
+    agg_parts.append(
+        _join_comparison_lines(ref_parts, hyp_parts, op_parts, include_space_separator)
+    )
+
+    return "".join(agg_parts)
+
+
+def _get_stars(length: int) -> str:
+    stars = _STARS.get(length)
 
-            ref_str += f"{rf:>{str_len}}"
-            hyp_str += f"{hp:>{str_len}}"
-            op_str += f"{c.upper():>{str_len}}"
+    if stars is None:
+        stars = _STARS[length] = "*" * length
 
-            if include_space_seperator:
-                ref_str += " "
-                hyp_str += " "
-                op_str += " "
+    return stars
 
-    if include_space_seperator:
+
+def _join_comparison_lines(
+    ref_parts: List[str],
+    hyp_parts: List[str],
+    op_parts: List[str],
+    include_space_separator: bool,
+) -> str:
+    if include_space_separator:
         # remove last space
-        return agg_str + f"{ref_str[:-1]}\n{hyp_str[:-1]}\n{op_str[:-1]}\n"
-    else:
-        return agg_str + f"{ref_str}\n{hyp_str}\n{op_str}\n"
+        ref_parts[-1] = ref_parts[-1][:-1]
+        hyp_parts[-1] = hyp_parts[-1][:-1]
+        op_parts[-1] = op_parts[-1][:-1]
+
+    return f"{''.join(ref_parts)}\n{''.join(hyp_parts)}\n{''.join(op_parts)}\n"
 
 
 def collect_error_counts(output: Union[WordOutput, CharacterOutput]):
@@ -238,6 +386,8 @@ def collect_error_counts(output: Union[WordOutput, CharacterOutput]):
     Returns:
         (Tuple[dict, dict, dict]): A three-tuple of dictionaries, in the order substitutions, insertions, deletions.
     """
+    _check_alignments(output)
+
     substitutions = defaultdict(lambda: 0)
     insertions = defaultdict(lambda: 0)
     deletions = defaultdict(lambda: 0)
@@ -248,13 +398,15 @@ def collect_error_counts(output: Union[WordOutput, CharacterOutput]):
         sep = " " if isinstance(output, WordOutput) else ""
 
         for chunk in sentence_chunks:
-            if chunk.type == "insert":
+            chunk_type = chunk.type
+
+            if chunk_type == "insert":
                 inserted = sep.join(hyp[chunk.hyp_start_idx : chunk.hyp_end_idx])
                 insertions[inserted] += 1
-            if chunk.type == "delete":
+            elif chunk_type == "delete":
                 deleted = sep.join(ref[chunk.ref_start_idx : chunk.ref_end_idx])
                 deletions[deleted] += 1
-            if chunk.type == "substitute":
+            elif chunk_type == "substitute":
                 replaced = sep.join(ref[chunk.ref_start_idx : chunk.ref_end_idx])
                 by = sep.join(hyp[chunk.hyp_start_idx : chunk.hyp_end_idx])
                 substitutions[(replaced, by)] += 1
@@ -311,6 +463,8 @@ def visualize_error_counts(
         a    = 1x
         ```
     """
+    _check_alignments(output)
+
     s, i, d = collect_error_counts(output)
 
     def build_list(errors: dict):
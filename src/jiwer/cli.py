@@ -22,6 +22,7 @@ Provide a simple CLI wrapper for JiWER. The CLI does not support custom transfor
 
 import click
 import pathlib
+import sys
 
 import jiwer
 
@@ -84,15 +85,8 @@ def cli(
     alignment.
 
     """
-    with reference_file.open("r") as f:
-        reference_sentences = [
-            ln.strip() for ln in f.readlines() if len(ln.strip()) > 1
-        ]
-
-    with hypothesis_file.open("r") as f:
-        hypothesis_sentences = [
-            ln.strip() for ln in f.readlines() if len(ln.strip()) > 1
-        ]
+    reference_sentences = _read_sentences(reference_file)
+    hypothesis_sentences = _read_sentences(hypothesis_file)
 
     if not global_alignment and len(reference_sentences) != len(hypothesis_sentences):
         raise ValueError(
@@ -112,11 +106,13 @@ def cli(
                 hypothesis_sentences,
                 reference_transform=jiwer.cer_contiguous,
                 hypothesis_transform=jiwer.cer_contiguous,
+                return_alignments=show_alignment,
             )
         else:
             out = jiwer.process_characters(
                 reference_sentences,
                 hypothesis_sentences,
+                return_alignments=show_alignment,
             )
     else:
         if global_alignment:
@@ -125,12 +121,18 @@ def cli(
                 hypothesis_sentences,
                 reference_transform=jiwer.wer_contiguous,
                 hypothesis_transform=jiwer.wer_contiguous,
+                return_alignments=show_alignment,
             )
         else:
-            out = jiwer.process_words(reference_sentences, hypothesis_sentences)
+            out = jiwer.process_words(
+                reference_sentences,
+                hypothesis_sentences,
+                return_alignments=show_alignment,
+            )
 
     if show_alignment:
-        print(jiwer.visualize_alignment(out, show_measures=True), end="")
+        # write the alignment sentence by sentence instead of building one string
+        jiwer.write_alignment(out, sys.stdout, show_measures=True)
     else:
         if compute_cer:
             print(out.cer)
@@ -138,5 +140,14 @@ def cli(
             print(out.wer)
 
 
+def _read_sentences(file: pathlib.Path):
+    # read the whole file at once and split it in a single call, which is faster
+    # than iterating over the file line by line. Note that `str.splitlines` would
+    # also split on characters such as form feeds, which are not line breaks here.
+    lines = map(str.strip, file.read_text().split("\n"))
+
+    return [ln for ln in lines if len(ln) > 1]
+
+
 if __name__ == "__main__":
     cli()
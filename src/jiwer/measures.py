@@ -39,13 +39,22 @@ It is more efficient to call `process_words` or `process_characters` and access
 results from the
 [jiwer.WordOutput][process.WordOutput] and
 [jiwer.CharacterOutput][process.CharacterOutput]
-classes.
+classes. To get the WER, MER, WIL and WIP from a single computation, without
+storing the alignments, use
+
+```python
+output = jiwer.process_words(reference, hypothesis, return_alignments=False)
+wer, mer, wil, wip = output.wer, output.mer, output.wil, output.wip
+```
+
+As `wer` and `cer` only require the levenshtein distance, they skip computing the
+edit operations altogether.
 """
 from typing import List, Union
 
 from jiwer import transforms as tr
 from jiwer.transformations import wer_default, cer_default
-from jiwer.process import process_words, process_characters
+from jiwer.process import process_words, _compute_error_rate
 
 __all__ = [
     "wer",
@@ -79,12 +88,11 @@ def wer(
         (float): The word error rate of the given reference and
                  hypothesis sentence(s).
     """
-    output = process_words(
+    # only the levenshtein distance is required, not the edit operations
+    return _compute_error_rate(
         reference, hypothesis, reference_transform, hypothesis_transform
     )
 
-    return output.wer
-
 
 def mer(
     reference: Union[str, List[str]] = None,
@@ -107,7 +115,11 @@ def mer(
                  hypothesis sentence(s).
     """
     output = process_words(
-        reference, hypothesis, reference_transform, hypothesis_transform
+        reference,
+        hypothesis,
+        reference_transform,
+        hypothesis_transform,
+        return_alignments=False,
     )
 
     return output.mer
@@ -134,7 +146,11 @@ def wip(
                  hypothesis sentence(s).
     """
     output = process_words(
-        reference, hypothesis, reference_transform, hypothesis_transform
+        reference,
+        hypothesis,
+        reference_transform,
+        hypothesis_transform,
+        return_alignments=False,
     )
 
     return output.wip
@@ -161,7 +177,11 @@ def wil(
                  hypothesis sentence(s).
     """
     output = process_words(
-        reference, hypothesis, reference_transform, hypothesis_transform
+        reference,
+        hypothesis,
+        reference_transform,
+        hypothesis_transform,
+        return_alignments=False,
     )
 
     return output.wil
@@ -191,8 +211,7 @@ def cer(
         (float): The character error rate of the given reference and hypothesis
                  sentence(s).
     """
-    output = process_characters(
+    # only the levenshtein distance is required, not the edit operations
+    return _compute_error_rate(
         reference, hypothesis, reference_transform, hypothesis_transform
     )
-
-    return output.cer
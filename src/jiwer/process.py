@@ -23,9 +23,9 @@ so that measures can be computed and an alignment can be visualized.
 
 from dataclasses import dataclass
 from collections import defaultdict
-from typing import Any, List, Union
+from typing import Any, List, Optional, Tuple, Union
 
-import rapidfuzz
+from rapidfuzz.distance import Levenshtein
 
 from jiwer import transforms as tr
 from jiwer.transformations import wer_default, cer_default
@@ -40,6 +40,11 @@ __all__ = [
 ]
 
 
+_ALIGNMENT_CHUNK_TYPES = frozenset(
+    ["replace", "insert", "delete", "equal", "substitute"]
+)
+
+
 @dataclass
 class AlignmentChunk:
     """
@@ -53,6 +58,16 @@ class AlignmentChunk:
         hyp_end_idx: the end index of the hypothesis subsequence
     """
 
+    # a chunk is created for every operation in every sentence, so store the fields
+    # in slots instead of a per-instance dictionary to save memory
+    __slots__ = (
+        "type",
+        "ref_start_idx",
+        "ref_end_idx",
+        "hyp_start_idx",
+        "hyp_end_idx",
+    )
+
     type: str
 
     ref_start_idx: int
@@ -62,7 +77,7 @@ class AlignmentChunk:
     hyp_end_idx: int
 
     def __post_init__(self):
-        if self.type not in ["replace", "insert", "delete", "equal", "substitute"]:
+        if self.type not in _ALIGNMENT_CHUNK_TYPES:
             raise ValueError("")
 
         # rapidfuzz uses replace instead of substitute... For consistency, we change it
@@ -92,7 +107,8 @@ class WordOutput:
     Attributes:
         references: The reference sentences
         hypotheses: The hypothesis sentences
-        alignments: The alignment between reference and hypothesis sentences
+        alignments: The alignment between reference and hypothesis sentences, or
+                    `None` if alignments were not requested
         wer: The word error rate
         mer: The match error rate
         wil: The word information lost measure
@@ -112,7 +128,7 @@ class WordOutput:
     hypotheses: List[List[str]]
 
     # alignment
-    alignments: List[List[AlignmentChunk]]
+    alignments: Optional[List[List[AlignmentChunk]]]
 
     # measures
     wer: float
@@ -132,6 +148,7 @@ def process_words(
     hypothesis: Union[str, List[str]],
     reference_transform: Union[tr.Compose, tr.AbstractTransform] = wer_default,
     hypothesis_transform: Union[tr.Compose, tr.AbstractTransform] = wer_default,
+    return_alignments: bool = True,
 ) -> WordOutput:
     """
     Compute the word-level levenshtein distance and alignment between one or more
@@ -143,6 +160,9 @@ def process_words(
         hypothesis: The hypothesis sentence(s)
         reference_transform: The transformation(s) to apply to the reference string(s)
         hypothesis_transform: The transformation(s) to apply to the hypothesis string(s)
+        return_alignments: If disabled, the alignment between each reference and
+                           hypothesis sentence is not stored in the output, which
+                           saves time and memory when only the measures are needed
 
     Returns:
         (WordOutput): The processed reference and hypothesis sentences
@@ -151,81 +171,28 @@ def process_words(
         ValueError: If one or more references are empty strings
         ValueError: If after applying transforms, reference and hypothesis lengths don't match
     """
-    # validate input type
-    if isinstance(reference, str):
-        reference = [reference]
-    if isinstance(hypothesis, str):
-        hypothesis = [hypothesis]
-
-    # pre-process reference and hypothesis by applying transforms
-    ref_transformed = _apply_transform(
-        reference, reference_transform, is_reference=True
-    )
-    hyp_transformed = _apply_transform(
-        hypothesis, hypothesis_transform, is_reference=False
+    ref_transformed, hyp_transformed, ref_encoded, hyp_encoded = _prepare(
+        reference, hypothesis, reference_transform, hypothesis_transform
     )
 
-    if len(ref_transformed) != len(hyp_transformed):
-        raise ValueError(
-            "After applying the transforms on the reference and hypothesis sentences, "
-            f"their lengths must match. "
-            f"Instead got {len(ref_transformed)} reference and "
-            f"{len(hyp_transformed)} hypothesis sentences."
-        )
-
-    # Map each word into a unique integer in order to compute
-    # word-level levenshtein distance
-    ref_as_ints, hyp_as_ints = _word2int(ref_transformed, hyp_transformed)
-
-    # keep track of total hits, substitutions, deletions and insertions
-    # across all input sentences
-    num_hits, num_substitutions, num_deletions, num_insertions = 0, 0, 0, 0
-
-    # also keep track of the total number of words in the reference and hypothesis
-    num_rf_words, num_hp_words = 0, 0
-
-    # anf finally, keep track of the alignment between each reference and hypothesis
-    alignments = []
+    # keep track of the total number of words in the reference and hypothesis
+    num_rf_words = sum(map(len, ref_encoded))
+    num_hp_words = sum(map(len, hyp_encoded))
 
-    for reference_sentence, hypothesis_sentence in zip(ref_as_ints, hyp_as_ints):
-        # Get the opcodes directly
-        opcodes = rapidfuzz.distance.Levenshtein.opcodes(
-            reference_sentence, hypothesis_sentence
+    # keep track of total substitutions, deletions and insertions across all input
+    # sentences, and the alignment between each reference and hypothesis
+    if return_alignments:
+        alignments, num_substitutions, num_deletions, num_insertions = _align_sentences(
+            ref_encoded, hyp_encoded
+        )
+    else:
+        alignments = None
+        num_substitutions, num_deletions, num_insertions = _count_edit_operations(
+            ref_encoded, hyp_encoded
         )
 
-        subs = dels = ins = hits = 0
-        sentence_op_chunks = []
-
-        for tag, i1, i2, j1, j2 in opcodes:
-            # Create alignment chunk
-            sentence_op_chunks.append(
-                AlignmentChunk(
-                    type=tag,
-                    ref_start_idx=i1,
-                    ref_end_idx=i2,
-                    hyp_start_idx=j1,
-                    hyp_end_idx=j2,
-                )
-            )
-
-            # Update counts
-            if tag == "equal":
-                hits += i2 - i1
-            elif tag == "replace":
-                subs += i2 - i1
-            elif tag == "delete":
-                dels += i2 - i1
-            elif tag == "insert":
-                ins += j2 - j1
-
-        # Update global counts
-        num_hits += hits
-        num_substitutions += subs
-        num_deletions += dels
-        num_insertions += ins
-        num_rf_words += len(reference_sentence)
-        num_hp_words += len(hypothesis_sentence)
-        alignments.append(sentence_op_chunks)
+    # every reference word is either a hit, a substitution or a deletion
+    num_hits = num_rf_words - num_substitutions - num_deletions
 
     # Compute all measures
     S, D, I, H = num_substitutions, num_deletions, num_insertions, num_hits
@@ -284,7 +251,8 @@ class CharacterOutput:
     Attributes:
         references: The reference sentences
         hypotheses: The hypothesis sentences
-        alignments: The alignment between reference and hypothesis sentences
+        alignments: The alignment between reference and hypothesis sentences, or
+                    `None` if alignments were not requested
         cer: The character error rate
         hits: The number of correct characters between reference and hypothesis
               sentences
@@ -301,7 +269,7 @@ class CharacterOutput:
     hypotheses: List[List[str]]
 
     # alignment
-    alignments: List[List[AlignmentChunk]]
+    alignments: Optional[List[List[AlignmentChunk]]]
 
     # measures
     cer: float
@@ -318,6 +286,7 @@ def process_characters(
     hypothesis: Union[str, List[str]],
     reference_transform: Union[tr.Compose, tr.AbstractTransform] = cer_default,
     hypothesis_transform: Union[tr.Compose, tr.AbstractTransform] = cer_default,
+    return_alignments: bool = True,
 ) -> CharacterOutput:
     """
     Compute the character-level levenshtein distance and alignment between one or more
@@ -333,6 +302,9 @@ def process_characters(
         hypothesis: The hypothesis sentence(s)
         reference_transform: The transformation(s) to apply to the reference string(s)
         hypothesis_transform: The transformation(s) to apply to the hypothesis string(s)
+        return_alignments: If disabled, the alignment between each reference and
+                           hypothesis sentence is not stored in the output, which
+                           saves time and memory when only the measures are needed
 
     Returns:
         (CharacterOutput): The processed reference and hypothesis sentences.
@@ -340,7 +312,11 @@ def process_characters(
     """
     # it's the same as word processing, just every word is of length 1
     result = process_words(
-        reference, hypothesis, reference_transform, hypothesis_transform
+        reference,
+        hypothesis,
+        reference_transform,
+        hypothesis_transform,
+        return_alignments=return_alignments,
     )
 
     return CharacterOutput(
@@ -359,6 +335,188 @@ def process_characters(
 # Implementation of helper methods
 
 
+def _prepare(
+    reference: Union[str, List[str]],
+    hypothesis: Union[str, List[str]],
+    reference_transform: Union[tr.Compose, tr.AbstractTransform],
+    hypothesis_transform: Union[tr.Compose, tr.AbstractTransform],
+):
+    """
+    Applies the transforms on the reference and hypothesis sentences, and encodes
+    them so that rapidfuzz can compute the levenshtein distance between them.
+
+    Returns:
+        Tuple[List[List[str]], List[List[str]], List, List]: The transformed reference
+        and hypothesis sentences, followed by their encoded versions
+    """
+    # validate input type
+    if isinstance(reference, str):
+        reference = [reference]
+    if isinstance(hypothesis, str):
+        hypothesis = [hypothesis]
+
+    # pre-process reference and hypothesis by applying transforms
+    ref_transformed, ref_joined = _apply_transform(
+        reference, reference_transform, is_reference=True
+    )
+    hyp_transformed, hyp_joined = _apply_transform(
+        hypothesis, hypothesis_transform, is_reference=False
+    )
+
+    if len(ref_transformed) != len(hyp_transformed):
+        raise ValueError(
+            "After applying the transforms on the reference and hypothesis sentences, "
+            f"their lengths must match. "
+            f"Instead got {len(ref_transformed)} reference and "
+            f"{len(hyp_transformed)} hypothesis sentences."
+        )
+
+    # Sentences of single characters (e.g., after `ReduceToListOfListOfChars`) can be
+    # compared by rapidfuzz as strings. Otherwise, map each word into a unique integer
+    # in order to compute word-level levenshtein distance
+    ref_encoded = _chars2str(ref_transformed, ref_joined)
+    hyp_encoded = _chars2str(hyp_transformed, hyp_joined)
+
+    if ref_encoded is None or hyp_encoded is None:
+        ref_encoded, hyp_encoded = _word2int(ref_transformed, hyp_transformed)
+
+    return ref_transformed, hyp_transformed, ref_encoded, hyp_encoded
+
+
+def _align_sentences(
+    ref_encoded: List, hyp_encoded: List
+) -> Tuple[List[List[AlignmentChunk]], int, int, int]:
+    """
+    Computes the alignment between each encoded reference and hypothesis sentence.
+
+    Returns:
+        Tuple[List[List[AlignmentChunk]], int, int, int]: The alignment of each
+        sentence pair, followed by the total number of substitutions, deletions and
+        insertions
+    """
+    alignments = []
+    num_substitutions, num_deletions, num_insertions = 0, 0, 0
+
+    # bind the methods once instead of resolving them in every iteration
+    get_opcodes = Levenshtein.opcodes
+    append_alignment = alignments.append
+    make_chunk = _make_alignment_chunk
+
+    for reference_sentence, hypothesis_sentence in zip(ref_encoded, hyp_encoded):
+        if reference_sentence == hypothesis_sentence:
+            # identical sentences only contain hits, and are common in low-error
+            # evaluation sets, so there is no need to call rapidfuzz
+            num_words = len(reference_sentence)
+            append_alignment(
+                [make_chunk("equal", 0, num_words, 0, num_words)]
+                if num_words > 0
+                else []
+            )
+            continue
+
+        sentence_op_chunks = []
+
+        for tag, i1, i2, j1, j2 in get_opcodes(reference_sentence, hypothesis_sentence):
+            # Create alignment chunk. rapidfuzz uses replace instead of substitute
+            sentence_op_chunks.append(
+                make_chunk("substitute" if tag == "replace" else tag, i1, i2, j1, j2)
+            )
+
+            # Update counts
+            if tag == "replace":
+                num_substitutions += i2 - i1
+            elif tag == "delete":
+                num_deletions += i2 - i1
+            elif tag == "insert":
+                num_insertions += j2 - j1
+
+        append_alignment(sentence_op_chunks)
+
+    return alignments, num_substitutions, num_deletions, num_insertions
+
+
+def _count_edit_operations(
+    ref_encoded: List, hyp_encoded: List
+) -> Tuple[int, int, int]:
+    """
+    Counts the edit operations between each encoded reference and hypothesis sentence.
+    Counting the individual edit operations is cheaper than building the opcodes,
+    which are derived from the same edit operations.
+
+    Returns:
+        Tuple[int, int, int]: The total number of substitutions, deletions and
+        insertions
+    """
+    num_substitutions, num_deletions, num_insertions = 0, 0, 0
+
+    # bind the method once instead of resolving it in every iteration
+    get_editops = Levenshtein.editops
+
+    for reference_sentence, hypothesis_sentence in zip(ref_encoded, hyp_encoded):
+        if reference_sentence == hypothesis_sentence:
+            # identical sentences only contain hits
+            continue
+
+        for op in get_editops(reference_sentence, hypothesis_sentence):
+            tag = op.tag
+            if tag == "replace":
+                num_substitutions += 1
+            elif tag == "delete":
+                num_deletions += 1
+            else:
+                num_insertions += 1
+
+    return num_substitutions, num_deletions, num_insertions
+
+
+def _compute_error_rate(
+    reference: Union[str, List[str]],
+    hypothesis: Union[str, List[str]],
+    reference_transform: Union[tr.Compose, tr.AbstractTransform],
+    hypothesis_transform: Union[tr.Compose, tr.AbstractTransform],
+) -> float:
+    """
+    Computes the same error rate as `process_words(...).wer`, but only with the
+    levenshtein distance of each sentence pair. As S + D + I is equal to the distance,
+    and H + S + D is equal to the length of the reference, the edit operations
+    themselves do not need to be computed.
+    """
+    _, _, ref_encoded, hyp_encoded = _prepare(
+        reference, hypothesis, reference_transform, hypothesis_transform
+    )
+
+    num_rf_words = sum(map(len, ref_encoded))
+    num_edits = sum(map(Levenshtein.distance, ref_encoded, hyp_encoded))
+
+    # special edge-case for empty references, in which every edit is an insertion
+    if num_rf_words == 0:
+        return num_edits
+
+    return float(num_edits) / float(num_rf_words)
+
+
+def _make_alignment_chunk(
+    type: str,
+    ref_start_idx: int,
+    ref_end_idx: int,
+    hyp_start_idx: int,
+    hyp_end_idx: int,
+) -> AlignmentChunk:
+    """
+    Creates an AlignmentChunk without the validation in `__post_init__`. This is only
+    safe for chunks which are valid by construction, such as the opcodes of rapidfuzz,
+    with `replace` already renamed to `substitute`.
+    """
+    chunk = object.__new__(AlignmentChunk)
+    chunk.type = type
+    chunk.ref_start_idx = ref_start_idx
+    chunk.ref_end_idx = ref_end_idx
+    chunk.hyp_start_idx = hyp_start_idx
+    chunk.hyp_end_idx = hyp_end_idx
+
+    return chunk
+
+
 def _apply_transform(
     sentence: Union[str, List[str]],
     transform: Union[tr.Compose, tr.AbstractTransform],
@@ -368,8 +526,11 @@ def _apply_transform(
     # list with lists of words
     transformed_sentence = transform(sentence)
 
-    # Validate the output is a list containing lists of strings
-    if not _is_list_of_list_of_strings(transformed_sentence):
+    # Validate the output is a list containing lists of strings. The joined sentences
+    # are kept, so that `_chars2str` does not need to join them a second time
+    joined_sentences = _join_list_of_list_of_strings(transformed_sentence)
+
+    if joined_sentences is None:
         raise ValueError(
             "After applying the transformation, each "
             f"{'reference' if is_reference else 'hypothesis'} should be a "
@@ -378,21 +539,73 @@ def _apply_transform(
             "to a list of list strings."
         )
 
-    return transformed_sentence
+    return transformed_sentence, joined_sentences
 
 
-def _is_list_of_list_of_strings(x: Any):
+def _join_list_of_list_of_strings(x: Any) -> Optional[List[str]]:
     if not isinstance(x, list):
-        return False
+        return None
+
+    # `str.join` checks in C that every element is a string, which is much faster
+    # than calling `isinstance` on each word
+    join = "".join
+    joined = []
 
     for e in x:
         if not isinstance(e, list):
-            return False
+            return None
+
+        try:
+            joined.append(join(e))
+        except TypeError:
+            return None
+
+    return joined
+
+
+def _chars2str(
+    sentences: List[List[str]], joined_sentences: List[str]
+) -> Optional[List[str]]:
+    """
+    Returns the joined sentences, if every word in every sentence is a single
+    character. As a string of characters can be compared directly, there is no need
+    to map each character to a unique integer.
+
+    Args:
+        sentences: List of sentences, where each sentence is a list of characters
+        joined_sentences: The words of each sentence joined into a single string
+
+    Returns:
+        Optional[List[str]]: The sentences as strings, or `None` if one or more
+        words are not a single character
+    """
+    for sentence, sentence_str in zip(sentences, joined_sentences):
+        if not _is_single_characters(sentence, sentence_str):
+            return None
+
+    return joined_sentences
+
+
+def _join_single_characters(tokens: List[str]) -> Optional[str]:
+    """
+    Joins the tokens into a string, if every token is a single character.
+
+    Args:
+        tokens: List of words or characters
+
+    Returns:
+        Optional[str]: The joined tokens, or `None` if one or more tokens are not a
+        single character
+    """
+    joined = "".join(tokens)
+
+    return joined if _is_single_characters(tokens, joined) else None
 
-        if not all([isinstance(s, str) for s in e]):
-            return False
 
-    return True
+def _is_single_characters(tokens: List[str], joined: str) -> bool:
+    # the tokens are all single characters if none are empty, and the length of the
+    # joined string matches the number of tokens
+    return len(joined) == len(tokens) and "" not in tokens
 
 
 def _word2int(reference: List[List[str]], hypothesis: List[List[str]]):
@@ -411,8 +624,9 @@ def _word2int(reference: List[List[str]], hypothesis: List[List[str]]):
     word2int = defaultdict()
     word2int.default_factory = word2int.__len__  # Auto-incrementing IDs
 
-    # Single pass through all words using generator expressions
-    ref_ints = [[word2int[word] for word in sentence] for sentence in reference]
-    hyp_ints = [[word2int[word] for word in sentence] for sentence in hypothesis]
+    # Look up the IDs with `map` so each sentence is converted in C
+    get_id = word2int.__getitem__
+    ref_ints = [list(map(get_id, sentence)) for sentence in reference]
+    hyp_ints = [list(map(get_id, sentence)) for sentence in hypothesis]
 
     return ref_ints, hyp_ints
@@ -39,13 +39,14 @@ import re
 import string
 import unicodedata
 
-from typing import Iterable, Union, List, Mapping
+from typing import Iterable, Union, List, Mapping, Optional
 
 
 __all__ = [
     "AbstractTransform",
     "Compose",
     "ExpandCommonEnglishContractions",
+    "NormalizeWhitespace",
     "RemoveEmptyStrings",
     "ReduceToListOfListOfWords",
     "ReduceToListOfListOfChars",
@@ -132,19 +133,62 @@ class Compose(object):
         return text
 
 
+_MIN_TOKENS_TO_TRANSLATE = 16
+
+
 class BaseRemoveTransform(AbstractTransform):
     def __init__(self, tokens_to_remove: Iterable[str], replace_token=""):
+        # a one-shot iterable, such as a generator, would be exhausted after the
+        # first string
+        if iter(tokens_to_remove) is tokens_to_remove:
+            tokens_to_remove = list(tokens_to_remove)
+
         self.tokens_to_remove = tokens_to_remove
         self.replace_token = replace_token
 
+        self._translation_key = None
+        self._translation = None
+
     def process_string(self, s: str):
+        return self._remove_tokens(s, self._get_translation())
+
+    def process_list(self, inp: List[str]):
+        translation = self._get_translation()
+
+        return [self._remove_tokens(s, translation) for s in inp]
+
+    def _remove_tokens(self, s: str, translation: Optional[dict]):
+        if translation is not None:
+            return s.translate(translation)
+
         for w in self.tokens_to_remove:
             s = s.replace(w, self.replace_token)
 
         return s
 
-    def process_list(self, inp: List[str]):
-        return [self.process_string(s) for s in inp]
+    def _get_translation(self) -> Optional[dict]:
+        # When many single characters are removed (e.g., all punctuation), deleting them
+        # in a single pass with `str.translate` is much faster than calling
+        # `str.replace` for each of them. For a few characters, `str.replace` is faster.
+        # The table is rebuilt whenever the tokens change, so that changes to
+        # `self.tokens_to_remove` and `self.replace_token` are still honored.
+        key = (tuple(self.tokens_to_remove), self.replace_token)
+
+        if key != self._translation_key:
+            tokens = set(key[0])
+
+            if (
+                self.replace_token == ""
+                and len(tokens) > _MIN_TOKENS_TO_TRANSLATE
+                and all(len(t) == 1 for t in tokens)
+            ):
+                self._translation = dict.fromkeys(map(ord, tokens))
+            else:
+                self._translation = None
+
+            self._translation_key = key
+
+        return self._translation
 
 
 class ReduceToListOfListOfWords(AbstractTransform):
@@ -292,9 +336,19 @@ class SubstituteRegexes(AbstractTransform):
         """
         self.substitutions = substitutions
 
+        # compile each regex once, instead of looking it up in the (limited) cache of
+        # the `re` module for every string. The patterns are compiled on first use, so
+        # that changes to `self.substitutions` are still honored.
+        self._patterns = {}
+
     def process_string(self, s: str):
         for key, value in self.substitutions.items():
-            s = re.sub(key, value, s)
+            pattern = self._patterns.get(key)
+
+            if pattern is None:
+                pattern = self._patterns[key] = re.compile(key)
+
+            s = pattern.sub(value, s)
 
         return s
 
@@ -327,9 +381,21 @@ class SubstituteWords(AbstractTransform):
         """
         self.substitutions = substitutions
 
+        # compile each regex once, instead of looking it up in the (limited) cache of
+        # the `re` module for every string. The patterns are compiled on first use, so
+        # that changes to `self.substitutions` are still honored.
+        self._patterns = {}
+
     def process_string(self, s: str):
         for key, value in self.substitutions.items():
-            s = re.sub(r"\b{}\b".format(re.escape(key)), value, s)
+            pattern = self._patterns.get(key)
+
+            if pattern is None:
+                pattern = self._patterns[key] = re.compile(
+                    r"\b{}\b".format(re.escape(key))
+                )
+
+            s = pattern.sub(value, s)
 
         return s
 
@@ -454,8 +520,10 @@ class RemoveMultipleSpaces(AbstractTransform):
 
     """
 
+    _pattern = re.compile(r"\s\s+")
+
     def process_string(self, s: str):
-        return re.sub(r"\s\s+", " ", s)
+        return self._pattern.sub(" ", s)
 
     def process_list(self, inp: List[str]):
         return [self.process_string(s) for s in inp]
@@ -481,6 +549,31 @@ class Strip(AbstractTransform):
         return s.strip()
 
 
+class NormalizeWhitespace(AbstractTransform):
+    """
+    Replaces every sequence of white space characters with a single space (` `), and
+    removes all leading and trailing white space. This is faster than applying
+    `RemoveMultipleSpaces` and `Strip` after each other, as it does not need a regex.
+
+    Note that, unlike `RemoveMultipleSpaces`, a single white space character
+    other than space (e.g., a tab) is also replaced by a space.
+
+    Example:
+        ```python
+        import jiwer
+
+        sentences = ["this is   an   example ", "  hello\tgoodbye  ", "  "]
+
+        print(jiwer.NormalizeWhitespace()(sentences))
+        # prints: ['this is an example', 'hello goodbye', '']
+        # note that there is an empty string left behind which might need to be cleaned up
+        ```
+    """
+
+    def process_string(self, s: str):
+        return " ".join(s.split())
+
+
 class RemoveEmptyStrings(AbstractTransform):
     """
     Remove empty strings from a list of strings.
@@ -536,23 +629,32 @@ class ExpandCommonEnglishContractions(AbstractTransform):
 
     """
 
-    def process_string(self, s: str):
-        # definitely a non exhaustive list
-
+    # definitely a non exhaustive list. Note that the replacements are applied one
+    # after the other, as a contraction can be part of a previously expanded string
+    _contractions = [
         # specific words
-        s = re.sub(r"won't", "will not", s)
-        s = re.sub(r"can\'t", "can not", s)
-        s = re.sub(r"let\'s", "let us", s)
-
+        ("won't", "will not"),
+        ("can't", "can not"),
+        ("let's", "let us"),
         # general attachments
-        s = re.sub(r"n\'t", " not", s)
-        s = re.sub(r"\'re", " are", s)
-        s = re.sub(r"\'s", " is", s)
-        s = re.sub(r"\'d", " would", s)
-        s = re.sub(r"\'ll", " will", s)
-        s = re.sub(r"\'t", " not", s)
-        s = re.sub(r"\'ve", " have", s)
-        s = re.sub(r"\'m", " am", s)
+        ("n't", " not"),
+        ("'re", " are"),
+        ("'s", " is"),
+        ("'d", " would"),
+        ("'ll", " will"),
+        ("'t", " not"),
+        ("'ve", " have"),
+        ("'m", " am"),
+    ]
+
+    def process_string(self, s: str):
+        # every contraction contains an apostrophe, so most strings can be skipped
+        if "'" not in s:
+            return s
+
+        # the contractions are plain strings, so there is no need for regexes
+        for contraction, expansion in self._contractions:
+            s = s.replace(contraction, expansion)
 
         return s
 
@@ -615,5 +717,7 @@ class RemoveKaldiNonWords(AbstractTransform):
         ```
     """
 
+    _pattern = re.compile(r"[<\[][^>\]]*[>\]]")
+
     def process_string(self, s: str):
-        return re.sub(r"[<\[][^>\]]*[>\]]", "", s)
+        return self._pattern.sub("", s)
@@ -1,3 +1,4 @@
+import io
 import unittest
 import jiwer
 from jiwer import visualize_alignment
@@ -185,6 +186,14 @@ HYP: split by ai
         )
         self.assertEqual(correct, alignment)
 
+    def test_without_alignments(self):
+        out = jiwer.process_words(
+            "this is a test", "this is the test", return_alignments=False
+        )
+
+        with self.assertRaises(ValueError):
+            visualize_alignment(out)
+
 
 class TestAlignmentVisualizationCharacters(unittest.TestCase):
     def test_insertion(self):
@@ -331,3 +340,39 @@ HYP: lit by ai
             show_measures=False,
         )
         self.assertEqual(correct, alignment)
+
+
+class TestWriteAlignment(unittest.TestCase):
+    def test_matches_visualize_alignment(self):
+        out = jiwer.process_words(
+            ["short one here", "quite a bit of longer sentence", "all correct"],
+            [
+                "shoe order one",
+                "quite bit of an even longest sentence here",
+                "all correct",
+            ],
+        )
+
+        for show_measures in [True, False]:
+            for skip_correct in [True, False]:
+                stream = io.StringIO()
+                jiwer.write_alignment(
+                    out,
+                    stream,
+                    show_measures=show_measures,
+                    skip_correct=skip_correct,
+                    line_width=20,
+                )
+                expected = jiwer.visualize_alignment(
+                    out,
+                    show_measures=show_measures,
+                    skip_correct=skip_correct,
+                    line_width=20,
+                )
+                self.assertEqual(stream.getvalue(), expected)
+
+    def test_without_alignments(self):
+        out = jiwer.process_words("a b", "a c", return_alignments=False)
+
+        with self.assertRaises(ValueError):
+            jiwer.write_alignment(out, io.StringIO())
@@ -100,6 +100,17 @@ class TestCERInputMethods(unittest.TestCase):
 
         self._apply_test_on(cases)
 
+    def test_multi_character_tokens(self):
+        # a custom transform can reduce to tokens which are not single characters
+        cer = jiwer.cer(
+            "hello world",
+            "hello duck",
+            reference_transform=jiwer.wer_default,
+            hypothesis_transform=jiwer.wer_default,
+        )
+
+        self.assertAlmostEqual(cer, 0.5, delta=1e-16)
+
     def _apply_test_on(self, cases):
         for ref, hyp, correct_cer in cases:
             cer = jiwer.cer(reference=ref, hypothesis=hyp)
@@ -0,0 +1,75 @@
+import pathlib
+import tempfile
+import unittest
+
+from click.testing import CliRunner
+
+import jiwer
+from jiwer.cli import cli
+
+
+class TestCLI(unittest.TestCase):
+    reference = ["short one here", "quite a bit of longer sentence", "all correct"]
+    hypothesis = [
+        "shoe order one",
+        "quite bit of an even longest sentence here",
+        "all correct",
+    ]
+
+    def _invoke(self, *args):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            reference_file = pathlib.Path(tmp_dir) / "ref.txt"
+            hypothesis_file = pathlib.Path(tmp_dir) / "hyp.txt"
+
+            reference_file.write_text("\n".join(self.reference) + "\n")
+            hypothesis_file.write_text("\n".join(self.hypothesis) + "\n")
+
+            result = CliRunner().invoke(
+                cli, ["-r", str(reference_file), "-h", str(hypothesis_file), *args]
+            )
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        return result.output
+
+    def test_wer(self):
+        output = self._invoke()
+        expected = jiwer.wer(self.reference, self.hypothesis)
+
+        self.assertEqual(output, f"{expected}\n")
+
+    def test_cer(self):
+        output = self._invoke("--cer")
+        expected = jiwer.cer(self.reference, self.hypothesis)
+
+        self.assertEqual(output, f"{expected}\n")
+
+    def test_align_words(self):
+        output = self._invoke("--align")
+        expected = jiwer.visualize_alignment(
+            jiwer.process_words(self.reference, self.hypothesis), show_measures=True
+        )
+
+        self.assertEqual(output, expected)
+
+    def test_align_characters(self):
+        output = self._invoke("--align", "--cer")
+        expected = jiwer.visualize_alignment(
+            jiwer.process_characters(self.reference, self.hypothesis),
+            show_measures=True,
+        )
+
+        self.assertEqual(output, expected)
+
+    def test_align_global(self):
+        output = self._invoke("--align", "--global")
+        expected = jiwer.visualize_alignment(
+            jiwer.process_words(
+                self.reference,
+                self.hypothesis,
+                reference_transform=jiwer.wer_contiguous,
+                hypothesis_transform=jiwer.wer_contiguous,
+            ),
+            show_measures=True,
+        )
+
+        self.assertEqual(output, expected)
@@ -1,3 +1,4 @@
+import pytest
 import jiwer
 
 ref = ["sub", "sub", "sub", "sub", "sub", "this was", "del", "hit"]
@@ -69,3 +70,13 @@ def test_show_selective():
     assert sub not in no_sub and ins in no_sub and del_ in no_sub
     assert sub in no_ins and ins not in no_ins and del_ in no_ins
     assert sub in no_del and ins in no_del and del_ not in no_del
+
+
+def test_without_alignments():
+    out = jiwer.process_words(ref, hyp, return_alignments=False)
+
+    with pytest.raises(ValueError):
+        jiwer.collect_error_counts(out)
+
+    with pytest.raises(ValueError):
+        jiwer.visualize_error_counts(out)
@@ -223,6 +223,16 @@ class TestMeasuresDefaultTransform(unittest.TestCase):
 
             self.assertRaises(ValueError, callback)
 
+    def test_fail_on_transform_without_strings(self):
+        for transformed in [[["a", 1]], [["a"], "b"], [("a", "b")], "a b"]:
+
+            def callback():
+                jiwer.process_words(
+                    "a b", "a b", reference_transform=lambda x: transformed
+                )
+
+            self.assertRaises(ValueError, callback)
+
     def test_known_values(self):
         # Taken from the "From WER and RIL to MER and WIL" paper, for link see README.md
         cases = [
@@ -274,9 +284,37 @@ class TestMeasuresDefaultTransform(unittest.TestCase):
 
         self._apply_test_on(cases)
 
+    def test_without_alignments(self):
+        ref = ["this is a test", "short one here", ""]
+        hyp = ["this is the test", "shoe order one", "silence"]
+
+        with_alignments = jiwer.process_words(ref, hyp)
+        without_alignments = jiwer.process_words(ref, hyp, return_alignments=False)
+
+        self.assertIsNone(without_alignments.alignments)
+        self.assertEqual(
+            to_measure_dict(with_alignments), to_measure_dict(without_alignments)
+        )
+        self.assertEqual(with_alignments.hits, without_alignments.hits)
+        self.assertEqual(
+            with_alignments.substitutions, without_alignments.substitutions
+        )
+        self.assertEqual(with_alignments.insertions, without_alignments.insertions)
+        self.assertEqual(with_alignments.deletions, without_alignments.deletions)
+
     def _apply_test_on(self, cases):
         for ref, hyp, correct_measures in cases:
             output = jiwer.process_words(reference=ref, hypothesis=hyp)
             output_dict = to_measure_dict(output)
 
             assert_dict_almost_equal(self, output_dict, correct_measures, delta=1e-16)
+
+            # the convenience methods compute the same measures
+            methods_dict = {
+                "wer": jiwer.wer(ref, hyp),
+                "mer": jiwer.mer(ref, hyp),
+                "wip": jiwer.wip(ref, hyp),
+                "wil": jiwer.wil(ref, hyp),
+            }
+
+            assert_dict_almost_equal(self, methods_dict, correct_measures, delta=1e-16)
@@ -1,7 +1,8 @@
+import string
 import unittest
 
 from jiwer.transforms import *
-from jiwer.transforms import ReduceToListOfListOfChars
+from jiwer.transforms import ReduceToListOfListOfChars, BaseRemoveTransform
 
 
 def _apply_test_on(self: unittest.TestCase, tr, cases):
@@ -227,6 +228,30 @@ class TestRemovePunctuation(unittest.TestCase):
 
         _apply_test_on(self, RemovePunctuation(), cases)
 
+    def test_changed_tokens(self):
+        transform = RemovePunctuation()
+        transform.tokens_to_remove = set(transform.tokens_to_remove) - {"!"}
+
+        _apply_test_on(self, transform, [(["hi! there."], ["hi! there"])])
+
+
+class TestBaseRemoveTransform(unittest.TestCase):
+    def test_mutated_tokens(self):
+        tokens = list(string.ascii_lowercase)
+        transform = BaseRemoveTransform(tokens)
+        _apply_test_on(self, transform, [(["ab1c2"], ["12"])])
+
+        tokens.remove("a")
+        _apply_test_on(self, transform, [(["ab1c2"], ["a12"])])
+
+        transform.replace_token = "_"
+        _apply_test_on(self, transform, [(["ab1c2"], ["a_1_2"])])
+
+    def test_generator(self):
+        transform = BaseRemoveTransform(c for c in "abc")
+
+        _apply_test_on(self, transform, [(["a1", "b2", "c3"], ["1", "2", "3"])])
+
 
 class TestRemoveMultipleSpaces(unittest.TestCase):
     def test_normal(self):
@@ -257,6 +282,21 @@ class TestSubstituteWords(unittest.TestCase):
             cases,
         )
 
+    def test_mutated_substitutions(self):
+        transform = SubstituteWords({"a": "b"})
+        _apply_test_on(self, transform, [(["a c"], ["b c"])])
+
+        transform.substitutions["c"] = "d"
+        del transform.substitutions["a"]
+        _apply_test_on(self, transform, [(["a c"], ["a d"])])
+
+        transform.substitutions["c"] = "e"
+        _apply_test_on(self, transform, [(["a c"], ["a e"])])
+
+        transform = SubstituteWords({})
+        transform.substitutions["c"] = "b"
+        _apply_test_on(self, transform, [(["a c"], ["a b"])])
+
 
 class TestSubstituteRegexes(unittest.TestCase):
     def test_normal(self):
@@ -272,6 +312,13 @@ class TestSubstituteRegexes(unittest.TestCase):
             cases,
         )
 
+    def test_mutated_substitutions(self):
+        transform = SubstituteRegexes({r"doom": r"sacr"})
+        _apply_test_on(self, transform, [(["doomed"], ["sacred"])])
+
+        transform.substitutions[r"\b(\w+)ed\b"] = r"\1"
+        _apply_test_on(self, transform, [(["doomed"], ["sacr"])])
+
 
 class TestStrip(unittest.TestCase):
     def test_normal(self):
@@ -285,6 +332,19 @@ class TestStrip(unittest.TestCase):
         _apply_test_on(self, Strip(), cases)
 
 
+class TestNormalizeWhitespace(unittest.TestCase):
+    def test_normal(self):
+        cases = [
+            (["this is   an   example "], ["this is an example"]),
+            (["  hello\tgoodbye  "], ["hello goodbye"]),
+            (["a\n\n b\t"], ["a b"]),
+            (["  "], [""]),
+            ("  hello  ", "hello"),
+        ]
+
+        _apply_test_on(self, NormalizeWhitespace(), cases)
+
+
 class TestRemoveEmptyStrings(unittest.TestCase):
     def test_normal(self):
         cases = [